@@ -1,9 +1,24 @@
 from django.contrib import admin
 from .models import Project, Board, List, Task, Label
 
+
+class BoardAdmin(admin.ModelAdmin):
+    def get_queryset(self, request):
+        # Uses the custom queryset so the admin list page fetches each board's project
+        # with a JOIN, instead of one extra query per row when "__str__" is rendered.
+        return Board.objects.with_related()
+
+
+class TaskAdmin(admin.ModelAdmin):
+    def get_queryset(self, request):
+        # Same idea as "BoardAdmin": pulls in the list/board/project chain and the labels
+        # up front so rendering the task list doesn't trigger extra queries per task.
+        return Task.objects.with_related()
+
+
 # Register your models here.
 admin.site.register(Project)
-admin.site.register(Board)
+admin.site.register(Board, BoardAdmin)
 admin.site.register(List)
-admin.site.register(Task)
+admin.site.register(Task, TaskAdmin)
 admin.site.register(Label)
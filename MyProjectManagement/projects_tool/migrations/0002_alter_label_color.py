@@ -0,0 +1,20 @@
+# Generated by Django 5.2.17 on 2026-08-31 23:10
+
+import django.core.validators
+import re
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects_tool', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='label',
+            name='color',
+            field=models.CharField(max_length=7, validators=[django.core.validators.RegexValidator(message='Color must be a valid hex code (e.g., #AABBCC).', regex=re.compile('^#([A-Fa-f0-9]{6})$'))]),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.17 on 2026-08-31 23:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects_tool', '0002_alter_label_color'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='list',
+            index=models.Index(fields=['board', 'position'], name='list_board_position_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['list', 'priority'], name='task_list_priority_idx'),
+        ),
+    ]
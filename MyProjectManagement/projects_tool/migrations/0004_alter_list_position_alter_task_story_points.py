@@ -0,0 +1,25 @@
+# Generated by Django 5.2.17 on 2026-08-31 23:11
+
+import django.core.validators
+import projects_tool.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects_tool', '0003_list_list_board_position_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='list',
+            name='position',
+            field=models.PositiveSmallIntegerField(),
+        ),
+        migrations.AlterField(
+            model_name='task',
+            name='story_points',
+            field=models.PositiveSmallIntegerField(validators=[django.core.validators.MinValueValidator(0), django.core.validators.MaxValueValidator(100), projects_tool.models.validate_divisible_by_5]),
+        ),
+    ]
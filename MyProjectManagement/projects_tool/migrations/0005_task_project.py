@@ -0,0 +1,35 @@
+# Generated by Django 5.2.17 on 2026-08-31 23:11
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def _backfill_task_project(apps, schema_editor):
+    # Fills in the denormalised project link for rows that existed before this field was
+    # added. Without this, project-scoped task queries would silently miss every
+    # pre-existing task (their project_id would stay NULL until their next save).
+    Task = apps.get_model('projects_tool', 'Task')
+    List = apps.get_model('projects_tool', 'List')
+    Task.objects.filter(project__isnull=True).update(
+        project=Subquery(
+            List.objects.filter(pk=OuterRef('list')).values('board__project')[:1]
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects_tool', '0004_alter_list_position_alter_task_story_points'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='task',
+            name='project',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='tasks', to='projects_tool.project'),
+        ),
+        # Reversing just drops the column again, so no reverse backfill is needed.
+        migrations.RunPython(_backfill_task_project, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.17 on 2026-08-31 23:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects_tool', '0005_task_project'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='task',
+            name='description',
+            field=models.TextField(blank=True, null=True),
+        ),
+    ]
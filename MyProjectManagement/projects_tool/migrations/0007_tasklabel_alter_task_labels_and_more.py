@@ -0,0 +1,45 @@
+# Generated by Django 5.2.17 on 2026-08-31 23:13
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects_tool', '0006_alter_task_description'),
+    ]
+
+    operations = [
+        # The explicit "TaskLabel" model points at the table the auto-generated through
+        # model already created, so the swap only needs to happen in Django's migration
+        # state - no tables are created, dropped or copied.
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.CreateModel(
+                    name='TaskLabel',
+                    fields=[
+                        ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                        ('label', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='projects_tool.label')),
+                        ('task', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='projects_tool.task')),
+                    ],
+                    options={
+                        'db_table': 'projects_tool_task_labels',
+                    },
+                ),
+                migrations.AlterField(
+                    model_name='task',
+                    name='labels',
+                    field=models.ManyToManyField(blank=True, related_name='tasks', through='projects_tool.TaskLabel', to='projects_tool.label'),
+                ),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='tasklabel',
+            index=models.Index(fields=['label', 'task'], name='tasklabel_label_task_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='tasklabel',
+            constraint=models.UniqueConstraint(fields=('task', 'label'), name='unique_label_per_task'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.17 on 2026-08-31 23:14
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects_tool', '0007_tasklabel_alter_task_labels_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='list',
+            options={'ordering': ['position']},
+        ),
+        migrations.AlterModelOptions(
+            name='task',
+            options={'ordering': ['task_no']},
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.17 on 2026-08-31 23:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects_tool', '0008_alter_list_options_alter_task_options'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='project',
+            name='slug',
+            field=models.SlugField(blank=True, max_length=64, unique=True),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.17 on 2026-08-31 23:19
+
+import projects_tool.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects_tool', '0009_alter_project_slug'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='task',
+            name='story_points',
+            field=models.PositiveSmallIntegerField(validators=[projects_tool.models.validate_story_points]),
+        ),
+    ]
@@ -0,0 +1,59 @@
+from django.db import migrations, models
+
+# Mapping from the old two-letter codes to the new integer values (1 = most urgent, so
+# ascending order is urgency order).
+_PRIORITY_CODES = {'HI': 1, 'ME': 2, 'LO': 3}
+
+
+def _codes_to_integers(apps, schema_editor):
+    Task = apps.get_model('projects_tool', 'Task')
+    for code, value in _PRIORITY_CODES.items():
+        Task.objects.filter(priority=code).update(priority_int=value)
+
+
+def _integers_to_codes(apps, schema_editor):
+    Task = apps.get_model('projects_tool', 'Task')
+    for code, value in _PRIORITY_CODES.items():
+        Task.objects.filter(priority_int=value).update(priority=code)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects_tool', '0010_alter_task_story_points'),
+    ]
+
+    operations = [
+        # The (list, priority) index has to come off while the column is swapped out;
+        # it is recreated on the integer column at the end.
+        migrations.RemoveIndex(
+            model_name='task',
+            name='task_list_priority_idx',
+        ),
+        # Add the integer column alongside the old one, copy the values across, then
+        # drop and rename - a straight AlterField can't convert 'HI'/'ME'/'LO' to ints.
+        migrations.AddField(
+            model_name='task',
+            name='priority_int',
+            field=models.PositiveSmallIntegerField(default=2),
+        ),
+        migrations.RunPython(_codes_to_integers, _integers_to_codes),
+        migrations.RemoveField(
+            model_name='task',
+            name='priority',
+        ),
+        migrations.RenameField(
+            model_name='task',
+            old_name='priority_int',
+            new_name='priority',
+        ),
+        migrations.AlterField(
+            model_name='task',
+            name='priority',
+            field=models.PositiveSmallIntegerField(choices=[(1, 'High'), (2, 'Medium'), (3, 'Low')], default=2),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['list', 'priority'], name='task_list_priority_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.17 on 2026-08-31 23:20
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects_tool', '0011_task_priority_integer'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='task',
+            options={'ordering': ['priority', 'task_no']},
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.17 on 2026-08-31 23:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects_tool', '0012_alter_task_options'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='task',
+            name='task_list_priority_idx',
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['list', 'priority', 'task_no'], name='task_list_prio_no_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['list', 'task_no'], name='task_list_task_no_idx'),
+        ),
+    ]
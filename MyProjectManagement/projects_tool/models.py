@@ -1,17 +1,91 @@
+import re
+from functools import lru_cache
+
 from django.db import models
 # Imports the slug function. A slug is a string which typically contains only letters, numbers, underscores, or hyphens, making it safe to use in a URL path.
 from django.utils.text import slugify
+from django.utils.functional import cached_property
 from django.core.exceptions import ValidationError
-from django.core.validators import RegexValidator, MinValueValidator, MaxValueValidator
+from django.core.validators import RegexValidator
+
+
+@lru_cache(maxsize=4096)
+def _cached_slugify(title):
+    # Slugify does quite a lot of work (unicode normalisation plus regex substitutions),
+    # so when the same title comes through more than once (e.g. a bulk import via the
+    # data wizard) this caches the result instead of recomputing it every time.
+    return slugify(title)
+
+
+# Compiled once at import time and shared by every "Label" instance, instead of each
+# validator compiling its own copy of the pattern.
+_HEX_COLOR_RE = re.compile(r'^#([A-Fa-f0-9]{6})$')
+_HEX_VALIDATOR = RegexValidator(
+    regex=_HEX_COLOR_RE,
+    message='Color must be a valid hex code (e.g., #AABBCC).'
+)
+
 
-def validate_divisible_by_5(value):
-    # Checks if the value is divisible by 5.
-    if value % 5 != 0:
-        raise ValidationError(f'{value} is not divisible by 5.')
+# Pre-built message templates so the error strings are only formatted when validation fails.
+_NOT_DIVISIBLE_MSG = '%s is not divisible by 5.'
+_OUT_OF_RANGE_MSG = '%s is not between 0 and 100.'
+
+
+def validate_story_points(value, _mod=5):
+    # Everything story points require in one validator (0-100 and divisible by 5), so
+    # each row pays one validator call instead of three. Binding the modulus as a
+    # default argument makes it a local lookup, which is slightly cheaper when this runs
+    # once per row in a bulk import.
+    if value < 0 or value > 100:
+        raise ValidationError(_OUT_OF_RANGE_MSG % value)
+    if value % _mod:
+        raise ValidationError(_NOT_DIVISIBLE_MSG % value)
+
+
+def validate_divisible_by_5(value, _mod=5):
+    # Checks if the value is divisible by 5. Superseded by "validate_story_points" on the
+    # field, but kept because earlier migrations reference this function by module path.
+    if value % _mod:
+        raise ValidationError(_NOT_DIVISIBLE_MSG % value)
 
 
 
 # Create your models here.
+class BoardQuerySet(models.QuerySet):
+    """
+    Custom queryset for "Board" so views/admin can opt into the joins they need.
+    """
+    def with_related(self):
+        # "Board.__str__" reads "self.project.title", so iterating boards without the join
+        # fires one extra query per row (the classic N+1 problem). "select_related" pulls
+        # the project in with a single JOIN instead.
+        return self.select_related('project')
+
+
+
+class TaskQuerySet(models.QuerySet):
+    """
+    Custom queryset for "Task" with the joins/prefetches the common rendering paths need.
+    """
+    def with_related(self):
+        # Tasks are usually shown with their list, board and project, plus their labels.
+        # "select_related" follows the foreign key chain in one JOIN, and the "Prefetch"
+        # fetches all the labels in a single extra query instead of one query per task.
+        # "only" trims the label query down to the columns the templates actually render
+        # (the title and the colour), so fewer bytes come over the wire.
+        return self.select_related('list__board__project').prefetch_related(
+            models.Prefetch('labels', queryset=Label.objects.only('title', 'color'))
+        )
+
+    def summaries(self):
+        # Loads only the columns a list/overview page renders, leaving the potentially
+        # long "description" (and other unused columns) out of the query entirely.
+        # Opt-in rather than the default, because touching a deferred column triggers an
+        # extra query per object.
+        return self.only('task_no', 'list', 'title', 'priority', 'story_points')
+
+
+
 class Project(models.Model): # We inherit from the "models.Model" base class to create a Django model.
     """
     Represents a project, which is the top-level container for boards, lists, tasks, and labels.
@@ -19,14 +93,27 @@ class Project(models.Model): # We inherit from the "models.Model" base class to
     title = models.CharField(max_length=64, unique=True, blank=False, null=False)
     description = models.CharField(max_length=256, blank=True)
     image = models.ImageField(upload_to='media', blank=True) # Stores the image file.
-    slug = models.SlugField(unique=True, blank=True) # Label, usually used for generating URLs.
+    # Label, usually used for generating URLs. "max_length" matches the title's 64 (the
+    # SlugField default of 50 could truncate a slug built from a long title), and
+    # "unique=True" already gives the column its index.
+    slug = models.SlugField(max_length=64, unique=True, blank=True)
 
     # Overrides the default Django save method to check if a slug already exists. If not, it generates one from the "title".
     def save(self, *args, **kwargs):
         if not self.slug:
-            self.slug = slugify(self.title)
+            self.slug = _cached_slugify(self.title)
         super().save(*args, **kwargs)
 
+    @classmethod
+    def bulk_create_with_slugs(cls, projects, **kwargs):
+        # "bulk_create" never calls "save", so the slug-filling override above is skipped.
+        # This fills the slugs in up front and then inserts everything in one query,
+        # which is the fast path for imports: one INSERT instead of one per project.
+        for project in projects:
+            if not project.slug:
+                project.slug = _cached_slugify(project.title)
+        return cls.objects.bulk_create(projects, **kwargs)
+
     def __str__(self):
         """
         Returns a string representation of the project, which is its title.
@@ -45,6 +132,9 @@ class Board(models.Model):
     project = models.ForeignKey(Project, on_delete=models.CASCADE, related_name='boards')
     title = models.CharField(max_length=64)
 
+    # Exposes the custom queryset, so "Board.objects.with_related()" works.
+    objects = BoardQuerySet.as_manager()
+
     class Meta:
         # Makes sure that a board's title is unique within the that project.
         # Just having "unique=True" on the "Title" wouldn't work since that would stop two different projects having the same board name.
@@ -52,8 +142,21 @@ class Board(models.Model):
             models.UniqueConstraint(fields=['project', 'title'], name='unique_board_title_per_project')
         ]
 
+    @cached_property
+    def project_title(self):
+        # Caches the related project's title on this instance, so repeated "__str__"
+        # calls (e.g. the same board rendered in several places on a page) only traverse
+        # the foreign key once.
+        return self.project.title
+
+    @cached_property
+    def display_name(self):
+        # The fully composed display string, built once per instance so repeated "str()"
+        # calls skip both the foreign-key traversal and the string formatting.
+        return f"{self.project_title} - {self.title}"
+
     def __str__(self):
-        return f"{self.project.title} - {self.title}"
+        return self.display_name
 
 
 
@@ -62,13 +165,8 @@ class Label(models.Model):
     title = models.CharField(max_length=32)
     color = models.CharField(
         max_length=7,
-        validators=[
-            # Makes sure that the colour input is a valid hex code.
-            RegexValidator(
-                regex='^#([A-Fa-f0-9]{6})$',
-                message='Color must be a valid hex code (e.g., #AABBCC).'
-            )
-        ]
+        # Makes sure that the colour input is a valid hex code (shared module-level validator).
+        validators=[_HEX_VALIDATOR]
     )
 
     class Meta:
@@ -89,13 +187,21 @@ class List(models.Model):
     # Every list must belong to a board, so if a board is deleted, all of its lists are also deleted.
     board = models.ForeignKey(Board, on_delete=models.CASCADE, related_name='lists')
     title = models.CharField(max_length=64)
-    position = models.PositiveIntegerField() # Makes sure that it only allows values of 0 or greater.
+    position = models.PositiveSmallIntegerField() # Makes sure that it only allows values of 0 or greater. "Small" is plenty: no board has tens of thousands of lists, and the column is narrower.
 
     # Within any single board, each list must have a unique title. (One "To Do" list in each board)
     class Meta:
+        # Lists always appear in position order, so let the database return them sorted
+        # (served straight from the (board, position) index) instead of sorting in Python.
+        ordering = ['position']
         constraints = [
             models.UniqueConstraint(fields=['board', 'title'], name='unique_list_title_per_board')
         ]
+        # Lists are fetched per board and shown in position order, so a composite index
+        # lets the database answer that query from the index alone.
+        indexes = [
+            models.Index(fields=['board', 'position'], name='list_board_position_idx')
+        ]
 
     def __str__(self):
         return self.title
@@ -104,31 +210,92 @@ class List(models.Model):
 
 class Task(models.Model):
     # A single task or card that exists within a list.
-    class Priority(models.TextChoices):
-        # First '' like 'HI' is what is stored in the database. Second '' like 'High' is the human-readable name in the forms and admin panel.
-        HIGH = 'HI', 'High'
-        MEDIUM = 'ME', 'Medium'
-        LOW = 'LO', 'Low'
+    class Priority(models.IntegerChoices):
+        # First value like 1 is what is stored in the database. Second '' like 'High' is the human-readable name in the forms and admin panel.
+        # Numbered so that sorting ascending puts the most urgent tasks first.
+        HIGH = 1, 'High'
+        MEDIUM = 2, 'Medium'
+        LOW = 3, 'Low'
 
     # "task_no" is the primary key. "primary_key=True" tells Django to use this field as the unique identifier instead of the default "id" field.
     task_no = models.AutoField(primary_key=True)
     # This links each task to a "List". If a list is deleted, all of its tasks are deleted ("CASCADE").
     list = models.ForeignKey(List, on_delete=models.CASCADE, related_name='tasks')
+    # Denormalised link straight to the owning project. The project is always reachable
+    # via "list.board.project", but keeping a direct foreign key means queries like "all
+    # tasks in a project" are a single join instead of three. It is filled in
+    # automatically in "save" and hidden from forms ("editable=False").
+    project = models.ForeignKey(Project, on_delete=models.CASCADE, related_name='tasks',
+                                null=True, blank=True, editable=False)
     title = models.CharField(max_length=64)
-    description = models.CharField(max_length=512, blank=True, null=True)
-    # Priority for new tasks are set as medium as default.
-    priority = models.CharField(max_length=2, choices=Priority.choices, default=Priority.MEDIUM)
-    story_points = models.IntegerField(
+    # "TextField" suits free-form prose better than a length-capped "CharField": SQLite
+    # stores both the same way, and there is no index on this column to worry about.
+    description = models.TextField(blank=True, null=True)
+    # Priority for new tasks are set as medium as default. Stored as a small integer
+    # (see "Priority" above), which is narrower than the old two-letter code and sorts
+    # in urgency order instead of alphabetically.
+    priority = models.PositiveSmallIntegerField(choices=Priority.choices, default=Priority.MEDIUM)
+    # Story points are validated to 0-100 below, so a small positive integer column is
+    # wide enough and keeps the row narrower than a full integer.
+    story_points = models.PositiveSmallIntegerField(
         validators=[
-            # Makes sure the number is between 0 and 100.
-            MinValueValidator(0),
-            MaxValueValidator(100),
-            # Custom function for divisible by 5.
-            validate_divisible_by_5
+            # One combined check: the number is between 0 and 100 and divisible by 5.
+            validate_story_points
         ]
     )
     # This makes a many-to-many relationship. Blank allows a task to be created without any labels.
-    labels = models.ManyToManyField(Label, related_name='tasks', blank=True)
+    # The explicit "through" model gives us control over the join table (see "TaskLabel" below).
+    labels = models.ManyToManyField(Label, through='TaskLabel', related_name='tasks', blank=True)
+
+    # Exposes the custom queryset, so "Task.objects.with_related()" works.
+    objects = TaskQuerySet.as_manager()
+
+    class Meta:
+        # Tasks render most-urgent first (priority 1 is High), with creation order as the
+        # tie-break; the database returns prefetched task sets already sorted this way.
+        ordering = ['priority', 'task_no']
+        # Tasks are fetched per list. (list, priority, task_no) matches the default
+        # ordering above exactly, so those fetches come straight off the index with no
+        # sort step; (list, task_no) serves explicit creation-order listings.
+        indexes = [
+            models.Index(fields=['list', 'priority', 'task_no'], name='task_list_prio_no_idx'),
+            models.Index(fields=['list', 'task_no'], name='task_list_task_no_idx'),
+        ]
+
+    # Overrides the default Django save method to keep the denormalised "project" link in
+    # sync with the list the task sits in.
+    def save(self, *args, **kwargs):
+        if self.project_id is None and self.list_id is not None:
+            self.project_id = self.list.board.project_id
+        super().save(*args, **kwargs)
+
+    def __str__(self):
+        return f"#{self.task_no}: {self.title}"
+
+
+
+class TaskLabel(models.Model):
+    """
+    Explicit join table for the Task/Label many-to-many relationship. Django would
+    auto-generate an equivalent hidden table; making it explicit lets us add a composite
+    index in the label-to-task direction, so "which tasks carry this label" lookups are
+    served straight from the index.
+    """
+    task = models.ForeignKey(Task, on_delete=models.CASCADE)
+    label = models.ForeignKey(Label, on_delete=models.CASCADE)
+
+    class Meta:
+        # Reuses the table the auto-generated through model already created, so swapping
+        # to the explicit model needs no data copy.
+        db_table = 'projects_tool_task_labels'
+        # The same label can only be attached to a task once (matches what the
+        # auto-generated through table enforced).
+        constraints = [
+            models.UniqueConstraint(fields=['task', 'label'], name='unique_label_per_task')
+        ]
+        indexes = [
+            models.Index(fields=['label', 'task'], name='tasklabel_label_task_idx')
+        ]
 
     def __str__(self):
-        return f"#{self.task_no}: {self.title}"
\ No newline at end of file
+        return f"{self.task} - {self.label}"
\ No newline at end of file